@@ -1222,12 +1222,14 @@ class AbstractCircuit(abc.ABC):
             The TextDiagramDrawer instance.
         """
         qubits = ops.QubitOrder.as_qubit_order(qubit_order).order_for(self.all_qubits())
-        cbits = tuple(
-            sorted(
-                set(key for op in self.all_operations() for key in protocols.control_keys(op)),
-                key=str,
-            )
-        )
+        # Collect control keys and detect global phase in a single pass over the operations.
+        control_keys: Set['cirq.MeasurementKey'] = set()
+        has_global_phase = False
+        for op in self.all_operations():
+            control_keys.update(protocols.control_keys(op))
+            if not has_global_phase and isinstance(op.gate, cirq.GlobalPhaseGate):
+                has_global_phase = True
+        cbits = tuple(sorted(control_keys, key=str))
         labels = qubits + cbits
         label_map = {labels[i]: i for i in range(len(labels))}
 
@@ -1249,7 +1251,7 @@ class AbstractCircuit(abc.ABC):
             diagram.write(0, i, name)
         first_annotation_row = max(label_map.values(), default=0) + 1
 
-        if any(isinstance(op.gate, cirq.GlobalPhaseGate) for op in self.all_operations()):
+        if has_global_phase:
             diagram.write(0, max(label_map.values(), default=0) + 1, 'global phase:')
             first_annotation_row += 1
 
@@ -58,9 +58,7 @@ def _render(diagram: circuits.TextDiagramDrawer) -> str:
         diagram2.write(2 * w - 1, y, r'&\qw\\')
     grid = diagram2.render(horizontal_spacing=0, vertical_spacing=0)
 
-    output = '\\Qcircuit @R=1em @C=0.75em {\n \\\\\n' + grid + '\n \\\\\n}'
-
-    return output
+    return f'\\Qcircuit @R=1em @C=0.75em {{\n \\\\\n{grid}\n \\\\\n}}'
 
 
 def circuit_to_latex_using_qcircuit(
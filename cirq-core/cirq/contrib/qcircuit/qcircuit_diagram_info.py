@@ -17,20 +17,24 @@ from typing import Optional, Tuple
 from cirq import ops, protocols
 
 
+_LATEX_ESCAPE_TABLE = str.maketrans(
+    {
+        '\\': r'\textbackslash{}',
+        '{': r'\{',
+        '}': r'\}',
+        '^': r'\textasciicircum{}',
+        '~': r'\textasciitilde{}',
+        '_': r'\_',
+        '$': r'\$',
+        '%': r'\%',
+        '&': r'\&',
+        '#': r'\#',
+    }
+)
+
+
 def escape_text_for_latex(text):
-    escaped = (
-        text.replace('\\', r'\textbackslash{}')
-        .replace('{', r'\{')
-        .replace('}', r'\}')
-        .replace('^', r'\textasciicircum{}')
-        .replace('~', r'\textasciitilde{}')
-        .replace('_', r'\_')
-        .replace('$', r'\$')
-        .replace('%', r'\%')
-        .replace('&', r'\&')
-        .replace('#', r'\#')
-    )
-    return r'\text{' + escaped + '}'
+    return r'\text{' + text.translate(_LATEX_ESCAPE_TABLE) + '}'
 
 
 def get_multigate_parameters(args: protocols.CircuitDiagramInfoArgs) -> Optional[Tuple[int, int]]:
@@ -87,9 +91,7 @@ def multigate_qcircuit_diagram_info(
     info = protocols.circuit_diagram_info(op, args, default=None)
 
     min_index, n_qubits = multigate_parameters
-    name = escape_text_for_latex(
-        str(op.gate).rsplit('**', 1)[0] if isinstance(op, ops.GateOperation) else str(op)
-    )
+    name = escape_text_for_latex(str(op.gate).rsplit('**', 1)[0])
     if (info is not None) and (info.exponent != 1):
         name += '^{' + str(info.exponent) + '}'
     box = r'\multigate{' + str(n_qubits - 1) + '}{' + name + '}'
@@ -107,7 +109,7 @@ def fallback_qcircuit_diagram_info(
     args = args.with_args(use_unicode_characters=False)
     info = protocols.circuit_diagram_info(op, args, default=None)
     if info is None:
-        name = str(op.gate or op)
+        name = str(op.gate if op.gate is not None else op)
         n_qubits = len(op.qubits)
         symbols = tuple(f'#{i + 1}' if i else name for i in range(n_qubits))
         info = protocols.CircuitDiagramInfo(symbols)
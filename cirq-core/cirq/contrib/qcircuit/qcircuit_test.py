@@ -139,6 +139,10 @@ def test_qcircuit_qubit_namer():
         qcircuit_diagram.qcircuit_qubit_namer(cirq.NamedQubit('q_{1}'))
         == r'\lstick{\text{q\_\{1\}}}&'
     )
+    assert (
+        qcircuit_diagram.qcircuit_qubit_namer(cirq.NamedQubit('q\\1'))
+        == r'\lstick{\text{q\textbackslash{}1}}&'
+    )
 
 
 def test_two_cx_diagram():
@@ -169,3 +173,16 @@ def test_sqrt_iswap_diagram():
  \\
 }""".strip()
     assert_has_qcircuit_diagram(circuit, expected_diagram)
+
+
+def test_gates_equal_to_hardcoded_gates_diagram():
+    q0, q1 = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(cirq.PhasedXPowGate(phase_exponent=0).on(q0), cirq.CZ(q0, q1))
+    expected_diagram = r"""
+\Qcircuit @R=1em @C=0.75em {
+ \\
+ &\lstick{\text{q(0)}}& \qw&\targ \qw&\control \qw    &\qw\\
+ &\lstick{\text{q(1)}}& \qw&      \qw&\control \qw\qwx&\qw\\
+ \\
+}""".strip()
+    assert_has_qcircuit_diagram(circuit, expected_diagram)
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
 QBLUE = '#1967d2'
 FONT = "Arial"
 EMPTY_MOMENT_COLWIDTH = float(21)  # assumed default column width
+_XML_ESCAPE_TABLE = str.maketrans({'<': '&lt;', '>': '&gt;'})
 
 
 def fixup_text(text: str):
@@ -19,8 +20,7 @@ def fixup_text(text: str):
     # https://github.com/quantumlib/Cirq/issues/2905
     text = text.replace('[<virtual>]', '')
     text = text.replace('[cirq.VirtualTag()]', '')
-    text = text.replace('<', '&lt;').replace('>', '&gt;')
-    return text
+    return text.translate(_XML_ESCAPE_TABLE)
 
 
 def _get_text_width(t: str) -> float: